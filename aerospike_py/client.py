@@ -1,11 +1,14 @@
 import asyncio
 import hashlib
+import os
+import struct
 
 from aerospike_py.connection import AsyncConnection
 from aerospike_py.info import request_info_keys
 from aerospike_py.result_code import ASMSGProtocolException
 from aerospike_py.message import ASIOException
 import aerospike_py.message
+import aerospike_py.predexp
 
 
 def hash_key(set='', key=''):
@@ -29,6 +32,21 @@ class AerospikeClient:
 
         return buckets
 
+    def _find_field(self, asmsg_fields, field_type):
+        for f_hdr, payload in asmsg_fields:
+            if f_hdr.field_type == field_type:
+                # the size in the field header includes the field type byte.
+                return payload[:f_hdr.size - 1]
+
+        return None
+
+    # predexp: a packed aerospike_py.predexp term, or a list of terms in postfix order.
+    def _predexp_fields(self, predexp):
+        if not predexp:
+            return []
+
+        return [aerospike_py.predexp.pack_predexp_field(predexp)]
+
     @asyncio.coroutine
     def _submit_message(self, envelope, retry_count=3, retry_excs=(14,)):
         while retry_count:
@@ -47,11 +65,16 @@ class AerospikeClient:
         return buckets
 
     @asyncio.coroutine
-    def _submit_batch(self, envelope, retry_count=3):
+    def _submit_batch(self, envelope, retry_count=3, keep=None, process=None):
+        if not process:
+            process = lambda x: self._process_bucket(x[3])
+
         while retry_count:
             try:
                 messages = yield from aerospike_py.message.submit_multi_message(self.conn, envelope)
-                return [self._process_bucket(x[3]) for x in messages]
+                if keep:
+                    messages = [x for x in messages if keep(x[1])]
+                return [process(x) for x in messages]
             except ASMSGProtocolException as e:
                 if e.result_code not in (14,):
                     raise
@@ -64,7 +87,7 @@ class AerospikeClient:
         return buckets
 
     @asyncio.coroutine
-    def get(self, namespace, set='', key='', bins=[], record_ttl=0, retry_count=3):
+    def get(self, namespace, set='', key='', bins=[], record_ttl=0, retry_count=3, predexp=None):
         flags = aerospike_py.message.AS_INFO1_READ
         if not bins:
             flags |= aerospike_py.message.AS_INFO1_GET_ALL
@@ -74,7 +97,7 @@ class AerospikeClient:
             [
                 aerospike_py.message.pack_asmsg_field(namespace.encode('UTF-8'), aerospike_py.message.AS_MSG_FIELD_TYPE_NAMESPACE),
                 aerospike_py.message.pack_asmsg_field(hash_key(set, key), aerospike_py.message.AS_MSG_FIELD_TYPE_DIGEST_RIPE),
-            ],
+            ] + self._predexp_fields(predexp),
             bin_cmds
         )
 
@@ -102,8 +125,40 @@ class AerospikeClient:
 
         return self._submit_batch(envelope, retry_count)
 
+    # scan only covers the partitions owned by the node this client is connected to;
+    # on a multi-node cluster it returns part of the namespace or set, not all of it.
+    @asyncio.coroutine
+    def scan(self, namespace, set='', bins=[], percent=100, priority=0, retry_count=3, predexp=None):
+        if not isinstance(percent, int) or not 1 <= percent <= 100:
+            raise ValueError('scan percent must be an integer between 1 and 100, got %r' % percent)
+
+        if not isinstance(priority, int) or not 0 <= priority <= 15:
+            raise ValueError('scan priority must be an integer between 0 and 15, got %r' % priority)
+
+        flags = aerospike_py.message.AS_INFO1_READ
+        if not bins:
+            flags |= aerospike_py.message.AS_INFO1_GET_ALL
+
+        fields = [aerospike_py.message.pack_asmsg_field(namespace.encode('UTF-8'), aerospike_py.message.AS_MSG_FIELD_TYPE_NAMESPACE)]
+        if set:
+            fields += [aerospike_py.message.pack_asmsg_field(set.encode('UTF-8'), aerospike_py.message.AS_MSG_FIELD_TYPE_SET)]
+
+        fields += [
+            aerospike_py.message.pack_asmsg_field(struct.pack('>BB', priority << 4, percent), aerospike_py.message.AS_MSG_FIELD_TYPE_SCAN_OPTIONS),
+            aerospike_py.message.pack_asmsg_field(os.urandom(8), aerospike_py.message.AS_MSG_FIELD_TYPE_TRID),
+        ]
+
+        bin_cmds = [aerospike_py.message.pack_asmsg_operation(aerospike_py.message.AS_MSG_OP_READ, 0, bn, b'') for bn in bins]
+        envelope = aerospike_py.message.pack_asmsg(flags, 0, 0, 0, 0, 0, fields + self._predexp_fields(predexp), bin_cmds)
+
+        # each record is returned as (digest, bins).  the final message only carries
+        # AS_INFO3_LAST and is not a record.
+        keep = lambda hdr: hdr.result_code == 0 and not (hdr.info3 & aerospike_py.message.AS_INFO3_LAST)
+        process = lambda x: (self._find_field(x[2], aerospike_py.message.AS_MSG_FIELD_TYPE_DIGEST_RIPE), self._process_bucket(x[3]))
+        return self._submit_batch(envelope, retry_count, keep, process)
+
     @asyncio.coroutine
-    def put(self, namespace, set='', key='', bins={}, create_only=False, bin_create_only=False, record_ttl=0, retry_count=3):
+    def put(self, namespace, set='', key='', bins={}, create_only=False, bin_create_only=False, record_ttl=0, retry_count=3, predexp=None):
         flags = aerospike_py.message.AS_INFO2_WRITE
         if create_only:
             flags |= aerospike_py.message.AS_INFO2_CREATE_ONLY
@@ -117,26 +172,26 @@ class AerospikeClient:
             [
                 aerospike_py.message.pack_asmsg_field(namespace.encode('UTF-8'), aerospike_py.message.AS_MSG_FIELD_TYPE_NAMESPACE),
                 aerospike_py.message.pack_asmsg_field(hash_key(set, key), aerospike_py.message.AS_MSG_FIELD_TYPE_DIGEST_RIPE),
-            ],
+            ] + self._predexp_fields(predexp),
             bin_cmds
         )
 
         return self._submit_message(envelope, retry_count)
 
     @asyncio.coroutine
-    def delete(self, namespace, set='', key='', record_ttl=0, retry_count=3):
+    def delete(self, namespace, set='', key='', record_ttl=0, retry_count=3, predexp=None):
         envelope = aerospike_py.message.pack_asmsg(0, aerospike_py.message.AS_INFO2_WRITE | aerospike_py.message.AS_INFO2_DELETE, 0, 0, record_ttl, 0,
             [
                 aerospike_py.message.pack_asmsg_field(namespace.encode('UTF-8'), aerospike_py.message.AS_MSG_FIELD_TYPE_NAMESPACE),
                 aerospike_py.message.pack_asmsg_field(hash_key(set, key), aerospike_py.message.AS_MSG_FIELD_TYPE_DIGEST_RIPE),
-            ],
+            ] + self._predexp_fields(predexp),
             []
         )
 
         return self._submit_message(envelope, retry_count)
 
     @asyncio.coroutine
-    def incr(self, namespace, set='', key='', bin='', incr_by=0, record_ttl=0, retry_count=3):
+    def incr(self, namespace, set='', key='', bin='', incr_by=0, record_ttl=0, retry_count=3, predexp=None):
         flags = aerospike_py.message.AS_INFO2_WRITE
 
         bin_cmds = [aerospike_py.message.pack_asmsg_operation(aerospike_py.message.AS_MSG_OP_INCR, 1, bin, aerospike_py.message.encode_payload(incr_by)[0])]
@@ -144,14 +199,14 @@ class AerospikeClient:
             [
                 aerospike_py.message.pack_asmsg_field(namespace.encode('UTF-8'), aerospike_py.message.AS_MSG_FIELD_TYPE_NAMESPACE),
                 aerospike_py.message.pack_asmsg_field(hash_key(set, key), aerospike_py.message.AS_MSG_FIELD_TYPE_DIGEST_RIPE),
-            ],
+            ] + self._predexp_fields(predexp),
             bin_cmds
         )
 
         return self._submit_message(envelope, retry_count, retry_excs=(2, 14,))
 
     @asyncio.coroutine
-    def _append_op(self, namespace, set='', key='', bin='', append_blob='', op=aerospike_py.message.AS_MSG_OP_APPEND, record_ttl=0, retry_count=3):
+    def _append_op(self, namespace, set='', key='', bin='', append_blob='', op=aerospike_py.message.AS_MSG_OP_APPEND, record_ttl=0, retry_count=3, predexp=None):
         flags = aerospike_py.message.AS_INFO2_WRITE
 
         blob = aerospike_py.message.encode_payload(append_blob)
@@ -160,23 +215,23 @@ class AerospikeClient:
             [
                 aerospike_py.message.pack_asmsg_field(namespace.encode('UTF-8'), aerospike_py.message.AS_MSG_FIELD_TYPE_NAMESPACE),
                 aerospike_py.message.pack_asmsg_field(hash_key(set, key), aerospike_py.message.AS_MSG_FIELD_TYPE_DIGEST_RIPE),
-            ],
+            ] + self._predexp_fields(predexp),
             bin_cmds
         )
 
         return self._submit_message(envelope, retry_count, retry_excs=(2, 14,))
 
     @asyncio.coroutine
-    def append(self, namespace, set='', key='', bin='', append_blob='', record_ttl=0):
-        return self._append_op(namespace, set, key, bin, append_blob, aerospike_py.message.AS_MSG_OP_APPEND, record_ttl)
+    def append(self, namespace, set='', key='', bin='', append_blob='', record_ttl=0, predexp=None):
+        return self._append_op(namespace, set, key, bin, append_blob, aerospike_py.message.AS_MSG_OP_APPEND, record_ttl, predexp=predexp)
 
     @asyncio.coroutine
-    def prepend(self, namespace, set='', key='', bin='', append_blob='', record_ttl=0):
-        return self._append_op(namespace, set, key, bin, append_blob, aerospike_py.message.AS_MSG_OP_PREPEND, record_ttl)
+    def prepend(self, namespace, set='', key='', bin='', append_blob='', record_ttl=0, predexp=None):
+        return self._append_op(namespace, set, key, bin, append_blob, aerospike_py.message.AS_MSG_OP_PREPEND, record_ttl, predexp=predexp)
 
     @asyncio.coroutine
-    def touch(self, namespace, set, key, bin='', record_ttl=0):
-        return self._append_op(namespace, set, key, bin, None, aerospike_py.message.AS_MSG_OP_TOUCH, record_ttl)
+    def touch(self, namespace, set, key, bin='', record_ttl=0, predexp=None):
+        return self._append_op(namespace, set, key, bin, None, aerospike_py.message.AS_MSG_OP_TOUCH, record_ttl, predexp=predexp)
 
 
 def connect(host: str, port: int) -> AerospikeClient:
@@ -3,7 +3,7 @@ from collections import namedtuple
 import struct
 
 from aerospike_py.connection import Connection, ASConnectionError
-from aerospike_py.result_code import ASMSGProtocolException
+from aerospike_py.result_code import ASMSGProtocolException, AS_ERR_KEY_NOT_FOUND_ERROR
 
 
 class ASIOException(Exception):
@@ -109,6 +109,7 @@ AS_MSG_FIELD_TYPE_DIGEST_RIPE = 4
 AS_MSG_FIELD_TYPE_DIGEST_RIPE_ARRAY = 6
 AS_MSG_FIELD_TYPE_TRID = 7
 AS_MSG_FIELD_TYPE_SCAN_OPTIONS = 8
+AS_MSG_FIELD_TYPE_PREDEXP = 43
 
 
 AS_MSG_PARTICLE_TYPE_NULL = 0
@@ -291,7 +292,7 @@ def submit_multi_message(conn: Connection, data: bytes) -> list:
                 asmsg_header, asmsg_fields, asmsg_ops, payload = unpack_asmsg(payload)
                 messages += [(header, asmsg_header, asmsg_fields, asmsg_ops)]
 
-            if asmsg_header.result_code not in (0, 2):
+            if asmsg_header.result_code not in (0, AS_ERR_KEY_NOT_FOUND_ERROR):
                 raise ASMSGProtocolException(asmsg_header.result_code)
 
             if (asmsg_header.info3 & AS_INFO3_LAST) == AS_INFO3_LAST:
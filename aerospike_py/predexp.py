@@ -0,0 +1,175 @@
+from collections import namedtuple
+import struct
+
+import aerospike_py.message
+
+
+# Predicate expressions are evaluated by the server against each candidate record,
+# so records which do not match are never sent back over the wire.  Expressions are
+# written in postfix order: operands first, then the operator which consumes them, e.g.
+#
+#   [string_bin('status'), string_value('active'), string_equal(),
+#    integer_bin('ts'), integer_value(X), integer_greater(),
+#    predexp_and(2)]
+AerospikePredExpHeader = namedtuple('AerospikePredExpHeader', ['tag', 'size'])
+AerospikePredExpHeaderStruct = struct.Struct('>HI')
+
+
+AS_PREDEXP_AND = 1
+AS_PREDEXP_OR = 2
+AS_PREDEXP_NOT = 3
+
+AS_PREDEXP_INTEGER_VALUE = 10
+AS_PREDEXP_STRING_VALUE = 11
+AS_PREDEXP_GEOJSON_VALUE = 12
+
+AS_PREDEXP_INTEGER_BIN = 100
+AS_PREDEXP_STRING_BIN = 101
+AS_PREDEXP_GEOJSON_BIN = 102
+
+AS_PREDEXP_REC_DEVICE_SIZE = 150
+AS_PREDEXP_REC_LAST_UPDATE = 151
+AS_PREDEXP_REC_VOID_TIME = 152
+AS_PREDEXP_REC_DIGEST_MODULO = 153
+
+AS_PREDEXP_INTEGER_EQUAL = 200
+AS_PREDEXP_INTEGER_UNEQUAL = 201
+AS_PREDEXP_INTEGER_GREATER = 202
+AS_PREDEXP_INTEGER_GREATEREQ = 203
+AS_PREDEXP_INTEGER_LESS = 204
+AS_PREDEXP_INTEGER_LESSEQ = 205
+
+AS_PREDEXP_STRING_EQUAL = 210
+AS_PREDEXP_STRING_UNEQUAL = 211
+AS_PREDEXP_STRING_REGEX = 212
+
+AS_PREDEXP_GEOJSON_WITHIN = 220
+AS_PREDEXP_GEOJSON_CONTAINS = 221
+
+
+def pack_predexp(tag: int, data: bytes = b'') -> bytes:
+    header = AerospikePredExpHeader(tag, len(data))
+    return AerospikePredExpHeaderStruct.pack(*header) + data
+
+
+def unpack_predexp(data: bytes) -> (AerospikePredExpHeader, bytes, bytes):
+    header = AerospikePredExpHeader(*AerospikePredExpHeaderStruct.unpack(data[0:6]))
+    return (header, data[6:6 + header.size], data[6 + header.size:])
+
+
+def pack_predexp_field(predexp) -> bytes:
+    """Packs either a single predicate term or a list of terms (in postfix order)."""
+    if isinstance(predexp, (bytes, bytearray)):
+        predexp = [predexp]
+
+    if not all(isinstance(term, (bytes, bytearray)) for term in predexp):
+        raise TypeError('predexp must be a packed predicate term or a list of them, got %r' % (predexp,))
+
+    return aerospike_py.message.pack_asmsg_field(b''.join(predexp), aerospike_py.message.AS_MSG_FIELD_TYPE_PREDEXP)
+
+
+# --- logical operators ---
+
+def predexp_and(nexpr: int) -> bytes:
+    return pack_predexp(AS_PREDEXP_AND, struct.pack('>H', nexpr))
+
+
+def predexp_or(nexpr: int) -> bytes:
+    return pack_predexp(AS_PREDEXP_OR, struct.pack('>H', nexpr))
+
+
+def predexp_not() -> bytes:
+    return pack_predexp(AS_PREDEXP_NOT)
+
+
+# --- values ---
+
+def integer_value(value: int) -> bytes:
+    return pack_predexp(AS_PREDEXP_INTEGER_VALUE, struct.pack('>q', value))
+
+
+def string_value(value: str) -> bytes:
+    return pack_predexp(AS_PREDEXP_STRING_VALUE, value.encode('UTF-8'))
+
+
+def geojson_value(value: str) -> bytes:
+    # flags (1 byte) and number of cell ids (2 bytes) precede the GeoJSON text.
+    return pack_predexp(AS_PREDEXP_GEOJSON_VALUE, struct.pack('>BH', 0, 0) + value.encode('UTF-8'))
+
+
+# --- bins ---
+
+def integer_bin(name: str) -> bytes:
+    return pack_predexp(AS_PREDEXP_INTEGER_BIN, name.encode('UTF-8'))
+
+
+def string_bin(name: str) -> bytes:
+    return pack_predexp(AS_PREDEXP_STRING_BIN, name.encode('UTF-8'))
+
+
+def geojson_bin(name: str) -> bytes:
+    return pack_predexp(AS_PREDEXP_GEOJSON_BIN, name.encode('UTF-8'))
+
+
+# --- record metadata ---
+
+def rec_device_size() -> bytes:
+    return pack_predexp(AS_PREDEXP_REC_DEVICE_SIZE)
+
+
+def rec_last_update() -> bytes:
+    return pack_predexp(AS_PREDEXP_REC_LAST_UPDATE)
+
+
+def rec_void_time() -> bytes:
+    return pack_predexp(AS_PREDEXP_REC_VOID_TIME)
+
+
+def rec_digest_modulo(mod: int) -> bytes:
+    return pack_predexp(AS_PREDEXP_REC_DIGEST_MODULO, struct.pack('>i', mod))
+
+
+# --- comparisons ---
+
+def integer_equal() -> bytes:
+    return pack_predexp(AS_PREDEXP_INTEGER_EQUAL)
+
+
+def integer_unequal() -> bytes:
+    return pack_predexp(AS_PREDEXP_INTEGER_UNEQUAL)
+
+
+def integer_greater() -> bytes:
+    return pack_predexp(AS_PREDEXP_INTEGER_GREATER)
+
+
+def integer_greatereq() -> bytes:
+    return pack_predexp(AS_PREDEXP_INTEGER_GREATEREQ)
+
+
+def integer_less() -> bytes:
+    return pack_predexp(AS_PREDEXP_INTEGER_LESS)
+
+
+def integer_lesseq() -> bytes:
+    return pack_predexp(AS_PREDEXP_INTEGER_LESSEQ)
+
+
+def string_equal() -> bytes:
+    return pack_predexp(AS_PREDEXP_STRING_EQUAL)
+
+
+def string_unequal() -> bytes:
+    return pack_predexp(AS_PREDEXP_STRING_UNEQUAL)
+
+
+def string_regex(flags: int = 0) -> bytes:
+    return pack_predexp(AS_PREDEXP_STRING_REGEX, struct.pack('>I', flags))
+
+
+def geojson_within() -> bytes:
+    return pack_predexp(AS_PREDEXP_GEOJSON_WITHIN)
+
+
+def geojson_contains() -> bytes:
+    return pack_predexp(AS_PREDEXP_GEOJSON_CONTAINS)
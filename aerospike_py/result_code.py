@@ -22,6 +22,8 @@ AS_ERR_KEY_BUSY = 14
 AS_ERR_INVALID_NAMESPACE = 20
 AS_ERR_BIN_NAME_TOO_LONG = 21
 
+AS_ERR_FILTERED_OUT = 27
+
 error_table = {
     AS_ERR_TYPE_NOT_SUPPORTED: "Type not supported",
     AS_ERR_COMMAND_REJECTED: "Command rejected",
@@ -46,6 +48,8 @@ error_table = {
 
     AS_ERR_INVALID_NAMESPACE: "Invalid namespace",
     AS_ERR_BIN_NAME_TOO_LONG: "Bin names must be less than 14 bytes",
+
+    AS_ERR_FILTERED_OUT: "Record did not match the predicate expression",
 }
 
 
@@ -0,0 +1,29 @@
+import asyncio
+import sys
+
+from pprint import pprint
+from aerospike_py.client import connect
+import aerospike_py.predexp as predexp
+
+# usage: query-scan.py hostname namespace set bin value [projected-bin ...]
+#
+# scans the set and only returns records whose string bin equals value, as
+# (digest, bins) tuples.  only the node at hostname is scanned, so on a multi-node
+# cluster the results cover that node's partitions rather than the whole set.
+hostname = sys.argv[1]
+namespace = sys.argv[2]
+set = sys.argv[3]
+bin = sys.argv[4]
+value = sys.argv[5]
+bins = sys.argv[6:]
+
+cli = connect(hostname, 3000)
+
+loop = asyncio.get_event_loop()
+records = loop.run_until_complete(cli.scan(namespace, set, bins, predexp=[
+    predexp.string_bin(bin),
+    predexp.string_value(value),
+    predexp.string_equal(),
+]))
+
+pprint(records)